@@ -0,0 +1,39 @@
+"""add item link reverse indexes
+
+Revision ID: 2d9f7b4e6a31
+Revises: c8a3f5e17d20
+Create Date: 2026-10-15 15:21:08.904417
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2d9f7b4e6a31"
+down_revision: str | None = "c8a3f5e17d20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The composite PKs lead with item_id; these cover category/tag -> items
+    # lookups and the ON DELETE CASCADE scans when a category or tag is removed
+    op.create_index(
+        "ix_item_categories_category_id",
+        "item_categories",
+        ["category_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_item_tags_tag_id",
+        "item_tags",
+        ["tag_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_item_tags_tag_id", table_name="item_tags")
+    op.drop_index("ix_item_categories_category_id", table_name="item_categories")
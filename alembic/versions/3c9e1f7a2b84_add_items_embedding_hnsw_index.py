@@ -0,0 +1,34 @@
+"""add items embedding hnsw index
+
+Revision ID: 3c9e1f7a2b84
+Revises: 6640663165bf
+Create Date: 2026-10-15 10:02:11.318204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9e1f7a2b84"
+down_revision: str | None = "6640663165bf"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # HNSW needs no training step, so recall holds even on an empty table
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 7")
+    op.execute(
+        """
+        CREATE INDEX items_embedding_idx ON items
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("items_embedding_idx", table_name="items")
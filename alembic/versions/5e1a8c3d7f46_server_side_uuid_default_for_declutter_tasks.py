@@ -0,0 +1,40 @@
+"""server-side uuid default for declutter_tasks
+
+Revision ID: 5e1a8c3d7f46
+Revises: 2d9f7b4e6a31
+Create Date: 2026-10-15 15:48:32.517960
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1a8c3d7f46"
+down_revision: str | None = "2d9f7b4e6a31"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # pgcrypto was enabled in c8a3f5e17d20
+    op.alter_column(
+        "declutter_tasks",
+        "id",
+        existing_type=sa.UUID(),
+        existing_nullable=False,
+        server_default=sa.text("gen_random_uuid()"),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "declutter_tasks",
+        "id",
+        existing_type=sa.UUID(),
+        existing_nullable=False,
+        server_default=None,
+    )
@@ -0,0 +1,77 @@
+"""add items embedding_256
+
+Revision ID: 71f0d3a8b29e
+Revises: e52a9c13f6d8
+Create Date: 2026-10-15 11:38:04.551972
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from pgvector.sqlalchemy import HALFVEC
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "71f0d3a8b29e"
+down_revision: str | None = "e52a9c13f6d8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _hnsw_params(vector_count: int) -> dict[str, int]:
+    """Pick HNSW build and search parameters for the given number of vectors."""
+    if vector_count < 100_000:
+        return {"m": 16, "ef_construction": 64, "ef_search": 40}
+    if vector_count < 1_000_000:
+        return {"m": 24, "ef_construction": 100, "ef_search": 80}
+    return {"m": 32, "ef_construction": 128, "ef_search": 100}
+
+
+def upgrade() -> None:
+    # Matryoshka truncation: first 256 dims of the full embedding, re-normalized.
+    # Generated so it follows every insert and embedding update; both functions
+    # are IMMUTABLE, and a NULL embedding yields a NULL embedding_256.
+    op.add_column(
+        "items",
+        sa.Column(
+            "embedding_256",
+            HALFVEC(256),
+            sa.Computed("l2_normalize(subvector(embedding, 1, 256))", persisted=True),
+            nullable=True,
+        ),
+    )
+
+    vector_count = (
+        op.get_bind()
+        .execute(sa.text("SELECT count(embedding_256) FROM items"))
+        .scalar()
+    )
+    params = _hnsw_params(vector_count)
+
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 7")
+    op.execute(
+        f"""
+        CREATE INDEX items_embedding_256_idx ON items
+        USING hnsw (embedding_256 halfvec_cosine_ops)
+        WITH (m = {params["m"]}, ef_construction = {params["ef_construction"]})
+        """
+    )
+
+    op.get_bind().execute(
+        sa.text(
+            "INSERT INTO _vector_config (index_name, m, ef_construction, ef_search) "
+            "VALUES ('items_embedding_256_idx', :m, :ef_construction, :ef_search)"
+        ),
+        params,
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DELETE FROM _vector_config WHERE index_name = 'items_embedding_256_idx'"
+    )
+    op.drop_index("items_embedding_256_idx", table_name="items")
+    op.drop_column("items", "embedding_256")
@@ -0,0 +1,76 @@
+"""tune items embedding hnsw params
+
+Revision ID: 8d41b6e0c7a5
+Revises: 3c9e1f7a2b84
+Create Date: 2026-10-15 10:31:47.902615
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d41b6e0c7a5"
+down_revision: str | None = "3c9e1f7a2b84"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _hnsw_params(vector_count: int) -> dict[str, int]:
+    """Pick HNSW build and search parameters for the given number of vectors."""
+    if vector_count < 100_000:
+        return {"m": 16, "ef_construction": 64, "ef_search": 40}
+    if vector_count < 1_000_000:
+        return {"m": 24, "ef_construction": 100, "ef_search": 80}
+    return {"m": 32, "ef_construction": 128, "ef_search": 100}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "_vector_config",
+        sa.Column("index_name", sa.String(length=100), nullable=False),
+        sa.Column("m", sa.Integer(), nullable=False),
+        sa.Column("ef_construction", sa.Integer(), nullable=False),
+        sa.Column("ef_search", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("index_name"),
+    )
+
+    vector_count = (
+        op.get_bind().execute(sa.text("SELECT count(embedding) FROM items")).scalar()
+    )
+    params = _hnsw_params(vector_count)
+
+    # Rebuild the index with parameters sized for the current corpus
+    op.drop_index("items_embedding_idx", table_name="items")
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 7")
+    op.execute(
+        f"""
+        CREATE INDEX items_embedding_idx ON items
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = {params["m"]}, ef_construction = {params["ef_construction"]})
+        """
+    )
+
+    op.get_bind().execute(
+        sa.text(
+            "INSERT INTO _vector_config (index_name, m, ef_construction, ef_search) "
+            "VALUES ('items_embedding_idx', :m, :ef_construction, :ef_search)"
+        ),
+        params,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("items_embedding_idx", table_name="items")
+    op.execute(
+        """
+        CREATE INDEX items_embedding_idx ON items
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+        """
+    )
+    op.drop_table("_vector_config")
@@ -0,0 +1,40 @@
+"""drop unused updated_at columns
+
+Revision ID: b0e7c45d9a13
+Revises: 71f0d3a8b29e
+Create Date: 2026-10-15 12:14:36.087251
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b0e7c45d9a13"
+down_revision: str | None = "71f0d3a8b29e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # No trigger or ORM onupdate ever touches these, so they mirror created_at
+    op.drop_column("items", "updated_at")
+    op.drop_column("categories", "updated_at")
+    op.drop_column("tags", "updated_at")
+
+
+def downgrade() -> None:
+    for table in ("items", "categories", "tags"):
+        op.add_column(
+            table,
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+        )
+        op.execute(f"UPDATE {table} SET updated_at = created_at")
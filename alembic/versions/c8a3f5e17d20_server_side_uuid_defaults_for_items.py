@@ -0,0 +1,45 @@
+"""server-side uuid defaults for items
+
+Revision ID: c8a3f5e17d20
+Revises: 4a6d2e8f1c57
+Create Date: 2026-10-15 13:22:18.540913
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8a3f5e17d20"
+down_revision: str | None = "4a6d2e8f1c57"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("items", "categories", "tags")
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto covers older servers
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "id",
+            existing_type=sa.UUID(),
+            existing_nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "id",
+            existing_type=sa.UUID(),
+            existing_nullable=False,
+            server_default=None,
+        )
@@ -0,0 +1,68 @@
+"""store items embedding as halfvec
+
+Revision ID: e52a9c13f6d8
+Revises: 8d41b6e0c7a5
+Create Date: 2026-10-15 11:05:22.417390
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from pgvector.sqlalchemy import HALFVEC, Vector
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e52a9c13f6d8"
+down_revision: str | None = "8d41b6e0c7a5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _rebuild_index(opclass: str) -> None:
+    params = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT m, ef_construction FROM _vector_config "
+                "WHERE index_name = 'items_embedding_idx'"
+            )
+        )
+        .one()
+    )
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute("SET LOCAL max_parallel_maintenance_workers = 7")
+    op.execute(
+        f"""
+        CREATE INDEX items_embedding_idx ON items
+        USING hnsw (embedding {opclass})
+        WITH (m = {params.m}, ef_construction = {params.ef_construction})
+        """
+    )
+
+
+def upgrade() -> None:
+    op.drop_index("items_embedding_idx", table_name="items")
+    op.alter_column(
+        "items",
+        "embedding",
+        type_=HALFVEC(1536),
+        existing_type=Vector(1536),
+        existing_nullable=True,
+        postgresql_using="embedding::halfvec(1536)",
+    )
+    _rebuild_index("halfvec_cosine_ops")
+
+
+def downgrade() -> None:
+    op.drop_index("items_embedding_idx", table_name="items")
+    op.alter_column(
+        "items",
+        "embedding",
+        type_=Vector(1536),
+        existing_type=HALFVEC(1536),
+        existing_nullable=True,
+        postgresql_using="embedding::vector(1536)",
+    )
+    _rebuild_index("vector_cosine_ops")
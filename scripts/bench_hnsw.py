@@ -0,0 +1,109 @@
+"""Benchmark HNSW parameters against the embeddings stored in ``items``.
+
+Usage: python -m scripts.bench_hnsw [--queries 200] [--k 10]
+
+Copies the embedded rows into a temporary table, computes exact top-k
+neighbours for a sample of query vectors, then for every (m, ef_construction)
+pair builds an HNSW index and measures P50/P95 latency and recall@k for each
+ef_search value. Nothing is written to ``items`` itself.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.core.config import settings
+
+M_VALUES = (16, 24, 32)
+EF_CONSTRUCTION_VALUES = (64, 128, 200)
+EF_SEARCH_VALUES = (40, 80, 100)
+
+KNN_QUERY = text(
+    "SELECT id FROM items_bench ORDER BY embedding <=> CAST(:q AS halfvec) LIMIT :k"
+)
+
+
+async def _knn(conn: AsyncConnection, query: str, k: int) -> tuple[list, float]:
+    start = time.perf_counter()
+    result = await conn.execute(KNN_QUERY, {"q": query, "k": k})
+    ids = [row[0] for row in result]
+    return ids, (time.perf_counter() - start) * 1000
+
+
+async def run(num_queries: int, k: int) -> None:
+    engine = create_async_engine(settings.database_url)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(
+                text(
+                    "CREATE TEMP TABLE items_bench AS "
+                    "SELECT id, embedding FROM items WHERE embedding IS NOT NULL"
+                )
+            )
+            total = await conn.scalar(text("SELECT count(*) FROM items_bench"))
+            if not total:
+                print("No embedded items to benchmark.")
+                return
+
+            result = await conn.execute(
+                text(
+                    "SELECT CAST(embedding AS text) FROM items_bench "
+                    "ORDER BY random() LIMIT :n"
+                ),
+                {"n": num_queries},
+            )
+            queries = [row[0] for row in result]
+
+            # Without an index the planner scans every row: exact ground truth
+            truth = [set((await _knn(conn, q, k))[0]) for q in queries]
+            print(f"{total} vectors, {len(queries)} queries, k={k}")
+            print("m\tef_c\tef_s\tp50_ms\tp95_ms\trecall")
+
+            await conn.execute(text("SET maintenance_work_mem = '2GB'"))
+            await conn.execute(text("SET max_parallel_maintenance_workers = 7"))
+            for m in M_VALUES:
+                for ef_construction in EF_CONSTRUCTION_VALUES:
+                    await conn.execute(text("DROP INDEX IF EXISTS items_bench_idx"))
+                    await conn.execute(
+                        text(
+                            "CREATE INDEX items_bench_idx ON items_bench "
+                            "USING hnsw (embedding halfvec_cosine_ops) "
+                            f"WITH (m = {m}, ef_construction = {ef_construction})"
+                        )
+                    )
+                    await conn.execute(text("ANALYZE items_bench"))
+
+                    for ef_search in EF_SEARCH_VALUES:
+                        await conn.execute(text(f"SET hnsw.ef_search = {ef_search}"))
+                        latencies = []
+                        hits = 0
+                        for query, expected in zip(queries, truth, strict=True):
+                            ids, elapsed = await _knn(conn, query, k)
+                            latencies.append(elapsed)
+                            hits += len(expected.intersection(ids))
+
+                        p50 = statistics.median(latencies)
+                        p95 = statistics.quantiles(latencies, n=20)[-1]
+                        recall = hits / (len(queries) * k)
+                        print(
+                            f"{m}\t{ef_construction}\t{ef_search}\t"
+                            f"{p50:.2f}\t{p95:.2f}\t{recall:.3f}"
+                        )
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.queries, args.k))
+
+
+if __name__ == "__main__":
+    main()
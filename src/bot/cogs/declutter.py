@@ -1,12 +1,18 @@
+import asyncio
 import logging
-from typing import Literal
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Literal
 from uuid import UUID
 
 import discord
 from discord import app_commands
 from discord.ext import commands
+from sqlalchemy import Row
 
-from src.core.database import get_db
+from src.core.database import get_db, get_read_db
+from src.models import DeclutterTask
 from src.services.ai import AIService
 from src.services.declutter import DeclutterTaskService
 
@@ -14,6 +20,100 @@ logger = logging.getLogger(__name__)
 
 # 數字表情符號對應
 NUMBER_EMOJIS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+EMOJI_TO_INDEX = {emoji: i for i, emoji in enumerate(NUMBER_EMOJIS)}
+
+# 建議與狀態的顯示文字
+DECISION_LABELS = {
+    "keep": "🟢 保留",
+    "consider": "🟡 考慮",
+    "discard": "🔴 捨棄",
+}
+DECISION_ICONS = {
+    "keep": "🟢",
+    "consider": "🟡",
+    "discard": "🔴",
+}
+DECISION_COLORS = {
+    "keep": discord.Color.green(),
+    "consider": discord.Color.gold(),
+    "discard": discord.Color.red(),
+}
+STATUS_LABELS = {
+    "pending": "⏳ 待處理",
+    "done": "✅ 已完成",
+    "dismissed": "❌ 已略過",
+}
+STATUS_ICONS = {
+    "pending": "⏳",
+    "done": "✅",
+    "dismissed": "❌",
+}
+
+# 最多追蹤的任務清單訊息數量，超過時淘汰最久未使用的
+TASK_LIST_MAPPING_MAX = 256
+
+# /tasks 查詢結果的快取秒數（統計僅供參考，短暫延遲可接受）
+TASKS_CACHE_TTL = 5.0
+
+# Vision API 支援的圖片格式
+ALLOWED_IMAGE_TYPES = frozenset({"image/jpeg", "image/png", "image/webp", "image/gif"})
+
+
+def _truncate(text: str, length: int) -> str:
+    """截斷過長文字並加上省略號"""
+    return text if len(text) <= length else f"{text[:length]}..."
+
+
+def _build_help_embed() -> discord.Embed:
+    """建立斷捨離功能說明（內容固定，匯入時建立一次）"""
+    embed = discord.Embed(
+        title="🧹 斷捨離功能說明",
+        description="上傳物品照片，AI 會幫你分析是否該保留或捨棄，並自動建立任務追蹤",
+        color=discord.Color.blue(),
+    )
+
+    embed.add_field(
+        name="📸 分析物品",
+        value="`/declutter` + 上傳照片 → AI 分析 + 建立任務",
+        inline=False,
+    )
+
+    embed.add_field(
+        name="📋 管理任務",
+        value=(
+            "`/tasks` - 查看任務清單（可點擊數字表情切換狀態）\n"
+            "`/task-view <編號>` - 查看詳情\n"
+            "`/task-done <編號>` - 標記完成\n"
+            "`/task-dismiss <編號>` - 略過任務\n"
+            "`/task-delete <編號>` - 刪除任務"
+        ),
+        inline=False,
+    )
+
+    embed.add_field(
+        name="🎯 斷捨離三原則",
+        value=(
+            "**斷** - 斷絕不需要的東西進入生活\n"
+            "**捨** - 捨棄堆放在家裡沒用的東西\n"
+            "**離** - 脫離對物品的執著"
+        ),
+        inline=False,
+    )
+
+    embed.add_field(
+        name="💡 建議結果",
+        value=(
+            "🟢 **保留** - 這個物品值得留下\n"
+            "🟡 **考慮** - 需要再想想\n"
+            "🔴 **捨棄** - 建議處理掉"
+        ),
+        inline=False,
+    )
+
+    return embed
+
+
+HELP_EMBED = _build_help_embed()
 
 
 class DeclutterCog(commands.Cog):
@@ -21,10 +121,35 @@ class DeclutterCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
-        self.ai_service = AIService()
-        # 儲存訊息 ID 與任務 ID 的對應關係
-        # {message_id: [task_id1, task_id2, ...]}
-        self.task_list_mapping: dict[int, list[UUID]] = {}
+        self.ai_service: AIService = bot.ai_service
+        # 儲存訊息 ID 與任務（ID、最後已知狀態，已刪除為 None）的對應關係
+        # {message_id: [(task_id1, status1), (task_id2, status2), ...]}
+        self.task_list_mapping: OrderedDict[int, list[tuple[UUID, str | None]]] = (
+            OrderedDict()
+        )
+        # /tasks 查詢快取 {key: (寫入時間, 結果)}，任何任務寫入都會清空
+        self._tasks_cache: dict[tuple, tuple[float, Any]] = {}
+        # 每次清空快取就遞增；查詢期間若有寫入，結果就不寫回快取
+        self._tasks_cache_generation = 0
+        # 背景通知任務的參照，避免執行中被回收
+        self._background_tasks: set[asyncio.Task] = set()
+
+    async def _cached(self, key: tuple, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """回傳未過期的快取結果，否則重新查詢並寫入快取"""
+        now = time.monotonic()
+        cached = self._tasks_cache.get(key)
+        if cached and now - cached[0] < TASKS_CACHE_TTL:
+            return cached[1]
+
+        generation = self._tasks_cache_generation
+        value = await factory()
+        if generation == self._tasks_cache_generation:
+            self._tasks_cache[key] = (now, value)
+        return value
+
+    def _invalidate_tasks_cache(self) -> None:
+        self._tasks_cache_generation += 1
+        self._tasks_cache.clear()
 
     @app_commands.command(name="declutter", description="上傳物品照片，獲得斷捨離建議")
     @app_commands.describe(image="要分析的物品照片")
@@ -33,9 +158,9 @@ class DeclutterCog(commands.Cog):
     ) -> None:
         """分析物品照片並提供斷捨離建議，自動建立任務追蹤"""
         # 檢查是否為圖片
-        if not image.content_type or not image.content_type.startswith("image/"):
+        if image.content_type not in ALLOWED_IMAGE_TYPES:
             await interaction.response.send_message(
-                "❌ 請上傳圖片檔案（JPG、PNG 等）",
+                "❌ 請上傳圖片檔案（JPG、PNG、WebP、GIF）",
                 ephemeral=True,
             )
             return
@@ -60,66 +185,56 @@ class DeclutterCog(commands.Cog):
             )
             return
 
-        decision_emoji = {
-            "keep": "🟢 保留",
-            "consider": "🟡 考慮",
-            "discard": "🔴 捨棄",
-        }
+        # 先組好所有任務內容，再一次寫入資料庫
+        source_channel = interaction.channel.name if interaction.channel else None
+        task_rows = []
+        for item in items:
+            decision = item.get("decision", "consider")
 
-        # 為每個物品建立任務
-        created_tasks = []
-        async with get_db() as db:
-            service = DeclutterTaskService(db)
-            for item in items:
-                item_name = item.get("name", "未知物品")
-                decision = item.get("decision", "consider")
-                reason = item.get("reason", "")
-                action = item.get("action", "")
-
-                # 組合分析內容
-                analysis = f"**建議**：{decision_emoji.get(decision, '❓')}\n\n"
-                analysis += f"**理由**：{reason}\n\n"
-                analysis += f"**行動建議**：{action}"
-
-                task = await service.create_task(
-                    item_name=item_name,
-                    analysis=analysis,
-                    decision=decision,
-                    image_url=image.url,
-                    source_channel=interaction.channel.name
-                    if interaction.channel
-                    else None,
-                    source_message_id=str(interaction.id),
-                )
-                created_tasks.append(
-                    {
-                        "task": task,
-                        "item": item,
-                    }
-                )
-
-        # 建立回應 Embed
-        embed = discord.Embed(
-            title=f"🧹 斷捨離分析結果（共 {len(created_tasks)} 個物品）",
-            description="已為照片中的每個物品建立獨立任務",
-            color=discord.Color.blue(),
-        )
-        embed.set_thumbnail(url=image.url)
+            # 組合分析內容
+            analysis = (
+                f"**建議**：{DECISION_LABELS.get(decision, '❓')}\n\n"
+                f"**理由**：{item.get('reason', '')}\n\n"
+                f"**行動建議**：{item.get('action', '')}"
+            )
 
-        for i, task_info in enumerate(created_tasks[:10]):  # 最多顯示 10 個
-            task = task_info["task"]
-            item = task_info["item"]
-            task_id = str(task.id)[:8]
-            decision = item.get("decision", "consider")
-            reason = item.get("reason", "")
+            task_rows.append(
+                {
+                    "item_name": item.get("name", "未知物品"),
+                    "analysis": analysis,
+                    "decision": decision,
+                    "image_url": image.url,
+                    "source_channel": source_channel,
+                    "source_message_id": str(interaction.id),
+                }
+            )
 
-            embed.add_field(
-                name=f"{NUMBER_EMOJIS[i]} {decision_emoji.get(decision, '❓')} {item.get('name', '未知')}",
-                value=f"`{task_id}` - {reason[:60]}{'...' if len(reason) > 60 else ''}",
-                inline=False,
+        async with get_db() as db:
+            service = DeclutterTaskService(db)
+            tasks = await service.create_tasks(task_rows)
+        self._invalidate_tasks_cache()
+
+        # 一次組好整個 Embed，最多顯示 10 個
+        fields = []
+        for i, (task, item) in enumerate(zip(tasks[:10], items, strict=False)):
+            fields.append(
+                {
+                    "name": f"{NUMBER_EMOJIS[i]} {DECISION_LABELS.get(item.get('decision', 'consider'), '❓')} {item.get('name', '未知')}",
+                    "value": f"`{task.id.hex[:8]}` - {_truncate(item.get('reason', ''), 60)}",
+                    "inline": False,
+                }
             )
 
-        embed.set_footer(text="使用 /tasks 查看任務清單並點擊表情快速標記完成")
+        embed = discord.Embed.from_dict(
+            {
+                "title": f"🧹 斷捨離分析結果（共 {len(tasks)} 個物品）",
+                "description": "已為照片中的每個物品建立獨立任務",
+                "color": discord.Color.blue().value,
+                "thumbnail": {"url": image.url},
+                "fields": fields,
+                "footer": {"text": "使用 /tasks 查看任務清單並點擊表情快速標記完成"},
+            }
+        )
 
         await interaction.followup.send(embed=embed)
 
@@ -140,12 +255,15 @@ class DeclutterCog(commands.Cog):
 
         await interaction.response.defer()
 
-        async with get_db() as db:
-            service = DeclutterTaskService(db)
-
-            filter_status = None if status == "all" else status
-            tasks = await service.list_tasks(status=filter_status, limit=limit)
-            stats = await service.get_stats()
+        # 兩個查詢各自使用連線池中的連線，同時執行
+        filter_status = None if status == "all" else status
+        tasks, stats = await asyncio.gather(
+            self._cached(
+                ("list", filter_status, limit),
+                lambda: self._fetch_tasks(filter_status, limit),
+            ),
+            self._cached(("stats",), self._fetch_stats),
+        )
 
         if not tasks:
             await interaction.followup.send(
@@ -154,69 +272,76 @@ class DeclutterCog(commands.Cog):
             )
             return
 
-        # 狀態符號
-        status_emoji = {
-            "pending": "⏳",
-            "done": "✅",
-            "dismissed": "❌",
-        }
-
-        decision_emoji = {
-            "keep": "🟢",
-            "consider": "🟡",
-            "discard": "🔴",
-        }
-
-        # 建立 Embed
-        embed = discord.Embed(
-            title="📋 斷捨離任務清單",
-            description=f"待處理: {stats['pending']} | 已完成: {stats['done']} | 已略過: {stats['dismissed']}\n\n點擊數字表情可快速切換完成狀態",
-            color=discord.Color.blue(),
-        )
-
-        task_ids: list[UUID] = []
+        task_entries: list[tuple[UUID, str | None]] = []
+        fields = []
         for i, task in enumerate(tasks):
-            task_ids.append(task.id)
-            task_id_short = str(task.id)[:8]
-            decision_icon = decision_emoji.get(task.decision, "⚪")
-            status_icon = status_emoji.get(task.status, "❓")
-            number_icon = NUMBER_EMOJIS[i]
-
-            # 截取簡短分析
-            short_analysis = (
-                task.analysis[:80] + "..." if len(task.analysis) > 80 else task.analysis
+            task_entries.append((task.id, task.status))
+            decision_icon = DECISION_ICONS.get(task.decision, "⚪")
+            status_icon = STATUS_ICONS.get(task.status, "❓")
+
+            fields.append(
+                {
+                    "name": f"{NUMBER_EMOJIS[i]} {status_icon} {decision_icon} {task.item_name}",
+                    "value": f"`{task.id.hex[:8]}` - {_truncate(task.analysis, 80)}",
+                    "inline": False,
+                }
             )
 
-            embed.add_field(
-                name=f"{number_icon} {status_icon} {decision_icon} {task.item_name}",
-                value=f"`{task_id_short}` - {short_analysis}",
-                inline=False,
-            )
-
-        embed.set_footer(text="點擊數字表情切換完成狀態 | /task-view <編號> 查看詳情")
+        # 建立 Embed
+        embed = discord.Embed.from_dict(
+            {
+                "title": "📋 斷捨離任務清單",
+                "description": f"待處理: {stats['pending']} | 已完成: {stats['done']} | 已略過: {stats['dismissed']}\n\n點擊數字表情可快速切換完成狀態",
+                "color": discord.Color.blue().value,
+                "fields": fields,
+                "footer": {
+                    "text": "點擊數字表情切換完成狀態 | /task-view <編號> 查看詳情"
+                },
+            }
+        )
 
         # 發送訊息
         message = await interaction.followup.send(embed=embed)
 
         # 儲存訊息與任務的對應關係
-        self.task_list_mapping[message.id] = task_ids
-
-        # 添加數字表情符號
-        for i in range(len(tasks)):
-            try:
-                await message.add_reaction(NUMBER_EMOJIS[i])
-            except discord.errors.Forbidden:
+        self.task_list_mapping[message.id] = task_entries
+        if len(self.task_list_mapping) > TASK_LIST_MAPPING_MAX:
+            self.task_list_mapping.popitem(last=False)
+
+        # 同時添加所有數字表情符號
+        results = await asyncio.gather(
+            *(message.add_reaction(NUMBER_EMOJIS[i]) for i in range(len(tasks))),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, discord.errors.Forbidden):
                 logger.warning("無法添加表情符號，可能缺少權限")
                 break
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _fetch_tasks(
+        self, status: str | None, limit: int
+    ) -> Sequence[DeclutterTask]:
+        async with get_read_db() as db:
+            service = DeclutterTaskService(db)
+            return await service.list_tasks(status=status, limit=limit)
+
+    async def _fetch_stats(self) -> dict[str, int]:
+        async with get_read_db() as db:
+            service = DeclutterTaskService(db)
+            return await service.get_stats()
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(
         self, payload: discord.RawReactionActionEvent
     ) -> None:
         """處理表情符號添加事件"""
-        # 忽略 Bot 自己的反應
+        # 忽略 Bot 自己的反應，以及非追蹤中訊息的反應
         if payload.user_id == self.bot.user.id:
             return
+        if payload.message_id not in self.task_list_mapping:
+            return
 
         await self._handle_reaction(payload, is_adding=True)
 
@@ -225,9 +350,11 @@ class DeclutterCog(commands.Cog):
         self, payload: discord.RawReactionActionEvent
     ) -> None:
         """處理表情符號移除事件"""
-        # 忽略 Bot 自己的反應
+        # 忽略 Bot 自己的反應，以及非追蹤中訊息的反應
         if payload.user_id == self.bot.user.id:
             return
+        if payload.message_id not in self.task_list_mapping:
+            return
 
         await self._handle_reaction(payload, is_adding=False)
 
@@ -235,55 +362,63 @@ class DeclutterCog(commands.Cog):
         self, payload: discord.RawReactionActionEvent, is_adding: bool
     ) -> None:
         """處理表情符號反應"""
-        message_id = payload.message_id
-        emoji = str(payload.emoji)
-
-        # 檢查是否為我們追蹤的訊息
-        if message_id not in self.task_list_mapping:
+        # 檢查是否為數字表情，並取得對應的任務索引
+        task_index = EMOJI_TO_INDEX.get(str(payload.emoji))
+        if task_index is None:
             return
 
-        # 檢查是否為數字表情
-        if emoji not in NUMBER_EMOJIS:
-            return
-
-        # 取得對應的任務索引
-        task_index = NUMBER_EMOJIS.index(emoji)
-        task_ids = self.task_list_mapping[message_id]
+        task_entries = self.task_list_mapping[payload.message_id]
+        # 仍在使用的清單移到最後，淘汰時最晚被移除（LRU）
+        self.task_list_mapping.move_to_end(payload.message_id)
 
         # 檢查索引是否有效
-        if task_index >= len(task_ids):
+        if task_index >= len(task_entries):
             return
 
-        task_id = task_ids[task_index]
+        task_id, current_status = task_entries[task_index]
+
+        # 根據是添加還是移除反應來切換狀態
+        # 添加反應 = 標記為完成，移除反應 = 標記為待處理
+        new_status = "done" if is_adding else "pending"
+
+        # 任務已刪除，或狀態未改變就不必寫入資料庫
+        if current_status is None or current_status == new_status:
+            return
 
-        # 更新任務狀態
         async with get_db() as db:
             service = DeclutterTaskService(db)
-            task = await service.get_task_by_id(task_id)
-
-            if task:
-                # 根據是添加還是移除反應來切換狀態
-                # 添加反應 = 標記為完成，移除反應 = 標記為待處理
-                new_status = "done" if is_adding else "pending"
-                task.status = new_status
-                item_name = task.item_name
-
-        # 發送通知訊息
-        try:
-            channel = self.bot.get_channel(payload.channel_id)
-            if channel:
-                if is_adding:
-                    await channel.send(
-                        f"✅ **{item_name}** 已標記為完成！",
-                        delete_after=5,
-                    )
-                else:
-                    await channel.send(
-                        f"⏳ **{item_name}** 已恢復為待處理",
-                        delete_after=5,
-                    )
-        except Exception as e:
-            logger.error(f"發送通知失敗: {e}")
+            item_name = await service.set_task_status(task_id, new_status)
+        self._invalidate_tasks_cache()
+
+        # 任務可能已被刪除
+        if item_name is None:
+            return
+
+        self._sync_task_lists(task_id, new_status)
+
+        # 在背景發送通知訊息，不阻塞反應處理
+        channel = self.bot.get_channel(payload.channel_id)
+        if channel:
+            if is_adding:
+                content = f"✅ **{item_name}** 已標記為完成！"
+            else:
+                content = f"⏳ **{item_name}** 已恢復為待處理"
+            task = asyncio.create_task(channel.send(content, delete_after=5))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._on_notification_done)
+
+    def _sync_task_lists(self, task_id: UUID, status: str | None) -> None:
+        """更新所有追蹤中清單裡該任務的最後已知狀態（None 表示已刪除）"""
+        for task_entries in self.task_list_mapping.values():
+            for index, (entry_id, _) in enumerate(task_entries):
+                if entry_id == task_id:
+                    task_entries[index] = (task_id, status)
+
+    def _on_notification_done(self, task: asyncio.Task) -> None:
+        """背景通知完成後釋放參照並記錄錯誤"""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("發送通知失敗", exc_info=task.exception())
 
     @app_commands.command(name="task-view", description="查看任務詳情")
     @app_commands.describe(task_id="任務編號（前 8 碼）")
@@ -295,7 +430,7 @@ class DeclutterCog(commands.Cog):
         """查看任務詳細內容"""
         await interaction.response.defer()
 
-        async with get_db() as db:
+        async with get_read_db() as db:
             service = DeclutterTaskService(db)
             task = await service.get_task_by_prefix(task_id)
 
@@ -306,29 +441,10 @@ class DeclutterCog(commands.Cog):
             )
             return
 
-        # 狀態符號
-        status_emoji = {
-            "pending": "⏳ 待處理",
-            "done": "✅ 已完成",
-            "dismissed": "❌ 已略過",
-        }
-
-        decision_emoji = {
-            "keep": "🟢 保留",
-            "consider": "🟡 考慮",
-            "discard": "🔴 捨棄",
-        }
-
-        color_map = {
-            "keep": discord.Color.green(),
-            "consider": discord.Color.gold(),
-            "discard": discord.Color.red(),
-        }
-
         embed = discord.Embed(
             title=f"📋 {task.item_name}",
             description=task.analysis,
-            color=color_map.get(task.decision, discord.Color.blue()),
+            color=DECISION_COLORS.get(task.decision, discord.Color.blue()),
         )
 
         if task.image_url:
@@ -336,17 +452,17 @@ class DeclutterCog(commands.Cog):
 
         embed.add_field(
             name="📊 建議",
-            value=decision_emoji.get(task.decision, "❓"),
+            value=DECISION_LABELS.get(task.decision, "❓"),
             inline=True,
         )
         embed.add_field(
             name="📌 狀態",
-            value=status_emoji.get(task.status, "❓"),
+            value=STATUS_LABELS.get(task.status, "❓"),
             inline=True,
         )
         embed.add_field(
             name="🔢 編號",
-            value=f"`{str(task.id)[:8]}`",
+            value=f"`{task.id.hex[:8]}`",
             inline=True,
         )
 
@@ -377,22 +493,18 @@ class DeclutterCog(commands.Cog):
         note: str | None = None,
     ) -> None:
         """標記任務為已完成"""
-        async with get_db() as db:
-            service = DeclutterTaskService(db)
-            task = await service.update_task_status(
-                task_id,
-                status="done",
-                action_taken=note,
-            )
+        # 資料庫更新與 Discord 回應同時進行
+        ok, task = await self._run_deferred(
+            interaction, self._update_task_status(task_id, "done", note)
+        )
+        if not ok:
+            return
 
         if not task:
-            await interaction.response.send_message(
-                f"❌ 找不到任務 `{task_id}`",
-                ephemeral=True,
-            )
+            await self._reply_private(interaction, f"❌ 找不到任務 `{task_id}`")
             return
 
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"✅ 已將 **{task.item_name}** 標記為完成！"
             + (f"\n📝 記錄：{note}" if note else ""),
         )
@@ -409,22 +521,18 @@ class DeclutterCog(commands.Cog):
         reason: str | None = None,
     ) -> None:
         """略過任務"""
-        async with get_db() as db:
-            service = DeclutterTaskService(db)
-            task = await service.update_task_status(
-                task_id,
-                status="dismissed",
-                action_taken=reason,
-            )
+        # 資料庫更新與 Discord 回應同時進行
+        ok, task = await self._run_deferred(
+            interaction, self._update_task_status(task_id, "dismissed", reason)
+        )
+        if not ok:
+            return
 
         if not task:
-            await interaction.response.send_message(
-                f"❌ 找不到任務 `{task_id}`",
-                ephemeral=True,
-            )
+            await self._reply_private(interaction, f"❌ 找不到任務 `{task_id}`")
             return
 
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"⏭️ 已略過 **{task.item_name}**"
             + (f"\n📝 原因：{reason}" if reason else ""),
         )
@@ -437,67 +545,77 @@ class DeclutterCog(commands.Cog):
         task_id: str,
     ) -> None:
         """刪除任務"""
-        async with get_db() as db:
-            service = DeclutterTaskService(db)
-            deleted = await service.delete_task(task_id)
+        # 資料庫刪除與 Discord 回應同時進行
+        ok, deleted = await self._run_deferred(interaction, self._delete_task(task_id))
+        if not ok:
+            return
 
         if not deleted:
-            await interaction.response.send_message(
-                f"❌ 找不到任務 `{task_id}`",
-                ephemeral=True,
-            )
+            await self._reply_private(interaction, f"❌ 找不到任務 `{task_id}`")
             return
 
-        await interaction.response.send_message(f"🗑️ 已刪除任務 `{task_id}`")
+        await interaction.followup.send(f"🗑️ 已刪除任務 `{task_id}`")
 
-    @app_commands.command(name="declutter-help", description="了解如何使用斷捨離功能")
-    async def declutter_help(self, interaction: discord.Interaction) -> None:
-        """顯示斷捨離功能說明"""
-        embed = discord.Embed(
-            title="🧹 斷捨離功能說明",
-            description="上傳物品照片，AI 會幫你分析是否該保留或捨棄，並自動建立任務追蹤",
-            color=discord.Color.blue(),
-        )
+    async def _run_deferred(
+        self, interaction: discord.Interaction, operation: Awaitable[Any]
+    ) -> tuple[bool, Any]:
+        """公開 defer 與資料庫操作同時進行，操作失敗時私下回報錯誤
 
-        embed.add_field(
-            name="📸 分析物品",
-            value="`/declutter` + 上傳照片 → AI 分析 + 建立任務",
-            inline=False,
-        )
-
-        embed.add_field(
-            name="📋 管理任務",
-            value=(
-                "`/tasks` - 查看任務清單（可點擊數字表情切換狀態）\n"
-                "`/task-view <編號>` - 查看詳情\n"
-                "`/task-done <編號>` - 標記完成\n"
-                "`/task-dismiss <編號>` - 略過任務\n"
-                "`/task-delete <編號>` - 刪除任務"
-            ),
-            inline=False,
-        )
-
-        embed.add_field(
-            name="🎯 斷捨離三原則",
-            value=(
-                "**斷** - 斷絕不需要的東西進入生活\n"
-                "**捨** - 捨棄堆放在家裡沒用的東西\n"
-                "**離** - 脫離對物品的執著"
-            ),
-            inline=False,
+        回傳 (是否成功, 操作結果)。
+        """
+        result, deferred = await asyncio.gather(
+            operation,
+            interaction.response.defer(),
+            return_exceptions=True,
         )
+        if isinstance(deferred, BaseException):
+            raise deferred
+        if isinstance(result, Exception):
+            logger.error("任務操作失敗", exc_info=result)
+            await self._reply_private(interaction, "❌ 操作失敗，請稍後再試")
+            return False, None
+        if isinstance(result, BaseException):
+            raise result
+        return True, result
+
+    async def _reply_private(
+        self, interaction: discord.Interaction, content: str
+    ) -> None:
+        """刪除公開的「思考中」訊息，改以僅自己可見的訊息回覆"""
+        await interaction.delete_original_response()
+        await interaction.followup.send(content, ephemeral=True)
+
+    async def _update_task_status(
+        self, task_id: str, status: str, action_taken: str | None
+    ) -> Row | None:
+        """在獨立的 session 中更新任務狀態"""
+        async with get_db() as db:
+            service = DeclutterTaskService(db)
+            task = await service.update_task_status(
+                task_id,
+                status=status,
+                action_taken=action_taken,
+            )
+        self._invalidate_tasks_cache()
+        if task:
+            self._sync_task_lists(task.id, status)
+        return task
 
-        embed.add_field(
-            name="💡 建議結果",
-            value=(
-                "🟢 **保留** - 這個物品值得留下\n"
-                "🟡 **考慮** - 需要再想想\n"
-                "🔴 **捨棄** - 建議處理掉"
-            ),
-            inline=False,
-        )
+    async def _delete_task(self, task_id: str) -> bool:
+        """在獨立的 session 中刪除任務"""
+        async with get_db() as db:
+            service = DeclutterTaskService(db)
+            deleted_id = await service.delete_task(task_id)
+        self._invalidate_tasks_cache()
+        if deleted_id is None:
+            return False
+        self._sync_task_lists(deleted_id, None)
+        return True
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    @app_commands.command(name="declutter-help", description="了解如何使用斷捨離功能")
+    async def declutter_help(self, interaction: discord.Interaction) -> None:
+        """顯示斷捨離功能說明"""
+        await interaction.response.send_message(embed=HELP_EMBED, ephemeral=True)
 
 
 async def setup(bot: commands.Bot) -> None:
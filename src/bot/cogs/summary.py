@@ -1,17 +1,28 @@
+import csv
 import io
-import json
 import logging
+import tempfile
 from datetime import UTC, datetime, timedelta
 
 import discord
+import orjson
 from discord import app_commands
 from discord.ext import commands
 
-from src.core.database import get_db
+from src.core.database import get_db, get_read_db
 from src.services.declutter import DeclutterTaskService
 
 logger = logging.getLogger(__name__)
 
+EXPORT_SPOOL_MAX_SIZE = 1 << 20
+
+# 進度條只有 11 種可能，預先建好
+PROGRESS_BAR_LENGTH = 10
+PROGRESS_BARS = tuple(
+    "█" * filled + "░" * (PROGRESS_BAR_LENGTH - filled)
+    for filled in range(PROGRESS_BAR_LENGTH + 1)
+)
+
 
 class SummaryCog(commands.Cog):
     """斷捨離統計與摘要指令"""
@@ -24,16 +35,16 @@ class SummaryCog(commands.Cog):
         """顯示斷捨離進度統計"""
         await interaction.response.defer()
 
-        async with get_db() as db:
+        async with get_read_db() as db:
             service = DeclutterTaskService(db)
-            stats = await service.get_stats()
-            recent_done = await service.get_recent_completed(days=7)
-            recent_created = await service.get_recent_created(days=7)
+            stats = await service.get_dashboard(days=7)
 
         total = stats["total"]
         done = stats["done"]
         pending = stats["pending"]
         dismissed = stats["dismissed"]
+        recent_done = stats["recent_done"]
+        recent_created = stats["recent_created"]
 
         # 計算完成率
         completion_rate = (done / total * 100) if total > 0 else 0
@@ -85,11 +96,10 @@ class SummaryCog(commands.Cog):
 
         await interaction.followup.send(embed=embed)
 
-    def _create_progress_bar(self, percentage: float, length: int = 10) -> str:
+    def _create_progress_bar(self, percentage: float) -> str:
         """建立進度條"""
-        filled = int(percentage / 100 * length)
-        empty = length - filled
-        return "█" * filled + "░" * empty
+        filled = int(percentage * PROGRESS_BAR_LENGTH / 100)
+        return PROGRESS_BARS[min(PROGRESS_BAR_LENGTH, max(0, filled))]
 
     @app_commands.command(name="summary", description="產生斷捨離成果報告")
     @app_commands.describe(period="報告的時間範圍")
@@ -118,7 +128,7 @@ class SummaryCog(commands.Cog):
             start_date = None
             period_name = "全部"
 
-        async with get_db() as db:
+        async with get_read_db() as db:
             service = DeclutterTaskService(db)
             completed_tasks = await service.get_completed_tasks(since=start_date)
             stats = await service.get_decision_stats(since=start_date)
@@ -148,7 +158,7 @@ class SummaryCog(commands.Cog):
 
         # 最近完成的物品
         recent_items = completed_tasks[:5]
-        items_text = "\n".join([f"• {task.item_name}" for task in recent_items])
+        items_text = "\n".join(f"• {task.item_name}" for task in recent_items)
         if len(completed_tasks) > 5:
             items_text += f"\n... 還有 {len(completed_tasks) - 5} 個"
 
@@ -185,56 +195,73 @@ class SummaryCog(commands.Cog):
         """匯出斷捨離任務記錄"""
         await interaction.response.defer(ephemeral=True)
 
-        async with get_db() as db:
-            service = DeclutterTaskService(db)
-            tasks = await service.list_tasks(status=None, limit=1000)
-
-        if not tasks:
-            await interaction.followup.send("📭 沒有任何記錄可匯出", ephemeral=True)
-            return
-
-        if format == "json":
-            data = [
-                {
-                    "id": str(task.id)[:8],
-                    "item_name": task.item_name,
-                    "decision": task.decision,
-                    "status": task.status,
-                    "analysis": task.analysis,
-                    "action_taken": task.action_taken,
-                    "created_at": task.created_at.isoformat(),
-                }
-                for task in tasks
-            ]
-            content = json.dumps(data, ensure_ascii=False, indent=2)
-            file_data = io.BytesIO(content.encode("utf-8"))
-            filename = "declutter_export.json"
-        else:
-            import csv
-
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(["編號", "物品", "建議", "狀態", "處理記錄", "建立時間"])
-            for task in tasks:
-                writer.writerow(
-                    [
-                        str(task.id)[:8],
-                        task.item_name,
-                        task.decision,
-                        task.status,
-                        task.action_taken or "",
-                        task.created_at.strftime("%Y-%m-%d %H:%M"),
-                    ]
-                )
-            file_data = io.BytesIO(output.getvalue().encode("utf-8"))
-            filename = "declutter_export.csv"
-
-        file = discord.File(fp=file_data, filename=filename)
-        await interaction.followup.send(
-            content=f"📦 這是你的斷捨離記錄（{format.upper()} 格式）：",
-            file=file,
-            ephemeral=True,
-        )
+        # 超過 1 MB 時改寫入暫存檔；離開時（含錯誤）一併關閉
+        with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE) as file_data:
+            count = 0
+
+            # 以伺服器端游標分批讀取、邊讀邊寫，不必一次載入全部任務
+            async with get_db() as db:
+                service = DeclutterTaskService(db)
+                tasks = service.stream_tasks(limit=1000)
+
+                if format == "json":
+                    async for task in tasks:
+                        file_data.write(b",\n" if count else b"[\n")
+                        # orjson 直接輸出 UTF-8 位元組，datetime 也會轉成 ISO 8601；
+                        # 每筆一行，不縮排
+                        file_data.write(
+                            orjson.dumps(
+                                {
+                                    "id": task.id.hex[:8],
+                                    "item_name": task.item_name,
+                                    "decision": task.decision,
+                                    "status": task.status,
+                                    "analysis": task.analysis,
+                                    "action_taken": task.action_taken,
+                                    "created_at": task.created_at,
+                                }
+                            )
+                        )
+                        count += 1
+                    if count:
+                        file_data.write(b"\n]\n")
+                    filename = "declutter_export.json"
+                else:
+                    # 直接寫入同一個位元組緩衝區，省去中間字串與編碼複製
+                    output = io.TextIOWrapper(
+                        file_data, encoding="utf-8", newline="", write_through=True
+                    )
+                    writer = csv.writer(output)
+                    writer.writerow(
+                        ["編號", "物品", "建議", "狀態", "處理記錄", "建立時間"]
+                    )
+                    async for task in tasks:
+                        writer.writerow(
+                            [
+                                task.id.hex[:8],
+                                task.item_name,
+                                task.decision,
+                                task.status,
+                                task.action_taken or "",
+                                task.created_at.strftime("%Y-%m-%d %H:%M"),
+                            ]
+                        )
+                        count += 1
+                    output.detach()
+                    filename = "declutter_export.csv"
+
+            if not count:
+                await interaction.followup.send("📭 沒有任何記錄可匯出", ephemeral=True)
+                return
+
+            file_data.seek(0)
+
+            file = discord.File(fp=file_data, filename=filename)
+            await interaction.followup.send(
+                content=f"📦 這是你的斷捨離記錄（{format.upper()} 格式）：",
+                file=file,
+                ephemeral=True,
+            )
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -6,6 +6,7 @@ from discord.ext import commands
 
 from src.core.config import settings
 from src.core.database import init_db
+from src.services.ai import AIService
 
 logging.basicConfig(
     level=logging.INFO,
@@ -13,6 +14,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+EXTENSIONS = (
+    "src.bot.cogs.declutter",
+    "src.bot.cogs.summary",
+)
+
 
 class DaijoubuBot(commands.Bot):
     def __init__(self) -> None:
@@ -27,25 +33,41 @@ class DaijoubuBot(commands.Bot):
 
     async def setup_hook(self) -> None:
         """Called when the bot is starting up."""
-        logger.info("Initializing database...")
-        await init_db()
+        # Shared by every cog so the OpenAI client's connection pool is reused
+        self.ai_service = AIService()
 
-        # Load cogs
-        await self.load_extension("src.bot.cogs.declutter")
-        await self.load_extension("src.bot.cogs.summary")
+        # Cogs don't touch the database while loading, so overlap them with init
+        logger.info("Initializing database...")
+        await asyncio.gather(
+            init_db(),
+            *(self.load_extension(ext) for ext in EXTENSIONS),
+        )
 
-        # Sync slash commands
+        # Sync slash commands in the background; startup doesn't wait on Discord
+        guild = None
         if settings.discord_guild_id:
             guild = discord.Object(id=int(settings.discord_guild_id))
             self.tree.copy_global_to(guild=guild)
+        self._sync_task = asyncio.create_task(self._sync_commands(guild))
+
+    async def _sync_commands(self, guild: discord.Object | None) -> None:
+        try:
             await self.tree.sync(guild=guild)
-            logger.info(f"Synced commands to guild {settings.discord_guild_id}")
+        except Exception as e:
+            logger.error("Failed to sync commands: %s", e)
+            return
+        if guild:
+            logger.info("Synced commands to guild %s", guild.id)
         else:
-            await self.tree.sync()
             logger.info("Synced commands globally")
 
+    async def close(self) -> None:
+        await super().close()
+        if hasattr(self, "ai_service"):
+            await self.ai_service.client.close()
+
     async def on_ready(self) -> None:
-        logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
+        logger.info("Logged in as %s (ID: %s)", self.user, self.user.id)
         logger.info("------")
 
 
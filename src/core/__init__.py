@@ -1,4 +1,4 @@
 from .config import settings
-from .database import get_db, init_db
+from .database import get_db, get_read_db, init_db
 
-__all__ = ["settings", "get_db", "init_db"]
+__all__ = ["settings", "get_db", "get_read_db", "init_db"]
@@ -1,7 +1,6 @@
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -28,5 +27,5 @@ class UUIDMixin:
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        server_default=text("gen_random_uuid()"),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -8,6 +8,11 @@ class DeclutterTask(Base, UUIDMixin, TimestampMixin):
     """斷捨離任務 - 儲存物品分析結果和處理狀態"""
 
     __tablename__ = "declutter_tasks"
+    __table_args__ = (
+        # /tasks 依建立時間倒序列出（可依狀態篩選），btree 可反向掃描
+        Index("ix_declutter_tasks_created_at", "created_at"),
+        Index("ix_declutter_tasks_status_created_at", "status", "created_at"),
+    )
 
     # 物品資訊
     item_name: Mapped[str] = mapped_column(String(200), nullable=False)
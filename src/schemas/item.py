@@ -27,6 +27,5 @@ class ItemResponse(BaseModel):
     categories: list[str] = []
     tags: list[str] = []
     created_at: datetime
-    updated_at: datetime
 
     model_config = {"from_attributes": True}
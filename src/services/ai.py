@@ -1,17 +1,39 @@
+import asyncio
+import json
 import logging
+from functools import cache
+from typing import Any
 
 from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
 
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 429s and connection errors are retried by the SDK with exponential backoff
+OPENAI_MAX_RETRIES = 3
+# Cap in-flight requests so upload bursts queue here instead of hitting rate limits
+OPENAI_MAX_CONCURRENCY = 8
+
+_request_slots = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+
+
+@cache
+def get_openai_client() -> AsyncOpenAI:
+    """Return the process-wide OpenAI client and its connection pool."""
+    return AsyncOpenAI(api_key=settings.openai_api_key, max_retries=OPENAI_MAX_RETRIES)
+
 
 class AIService:
     """Service for AI operations using OpenAI API."""
 
     def __init__(self) -> None:
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.client = get_openai_client()
+
+    async def _create_chat_completion(self, **kwargs: Any) -> ChatCompletion:
+        async with _request_slots:
+            return await self.client.chat.completions.create(**kwargs)
 
     async def analyze_image_for_declutter(self, image_url: str) -> dict:
         """Analyze an image and provide decluttering advice for each item."""
@@ -21,7 +43,7 @@ class AIService:
             }
 
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_chat_completion(
                 model=settings.vision_model,
                 messages=[
                     {
@@ -82,48 +104,24 @@ decision 對應：
                 ],
                 max_tokens=2000,
                 temperature=0.7,
+                response_format={"type": "json_object"},
             )
 
-            content = response.choices[0].message.content.strip()
-
-            # 嘗試解析 JSON
-            import json
-            import re
-
-            # 移除可能的 markdown 代碼塊標記
-            content = re.sub(r"^```json\s*", "", content)
-            content = re.sub(r"\s*```$", "", content)
+            data = json.loads(response.choices[0].message.content)
+            items = data.get("items", [])
 
-            try:
-                data = json.loads(content)
-                items = data.get("items", [])
-
-                if not items:
-                    return {
-                        "error": "無法識別照片中的物品",
-                    }
-
-                return {
-                    "success": True,
-                    "items": items,
-                }
-            except json.JSONDecodeError:
-                # 如果 JSON 解析失敗，嘗試舊的單一分析格式
-                logger.warning(f"JSON 解析失敗，使用原始回應: {content[:100]}...")
+            if not items:
                 return {
-                    "success": True,
-                    "items": [
-                        {
-                            "name": "未知物品",
-                            "decision": "consider",
-                            "reason": content[:200],
-                            "action": "請重新拍攝更清晰的照片",
-                        }
-                    ],
+                    "error": "無法識別照片中的物品",
                 }
 
+            return {
+                "success": True,
+                "items": items,
+            }
+
         except Exception as e:
-            logger.error(f"Error analyzing image: {e}")
+            logger.error("Error analyzing image: %s", e)
             return {
                 "error": f"分析圖片時發生錯誤：{e}",
             }
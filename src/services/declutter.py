@@ -1,12 +1,37 @@
+import string
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime, timedelta
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import String, and_, func, select
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    ScalarSelect,
+    and_,
+    delete,
+    false,
+    func,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import DeclutterTask
 
 
+def uuid_prefix_range(prefix: str) -> tuple[UUID, UUID] | None:
+    """Return the lowest and highest UUIDs starting with a hex prefix.
+
+    Hyphens are ignored. Returns None if the prefix has no hex digits or is
+    not valid hex.
+    """
+    digits = prefix.replace("-", "").lower()
+    if not digits or len(digits) > 32 or digits.strip(string.hexdigits):
+        return None
+    return UUID(digits.ljust(32, "0")), UUID(digits.ljust(32, "f"))
+
+
 class DeclutterTaskService:
     """Service for managing declutter tasks."""
 
@@ -37,11 +62,26 @@ class DeclutterTaskService:
         await self.db.flush()
         return task
 
+    async def create_tasks(self, tasks: list[dict]) -> Sequence[DeclutterTask]:
+        """Create several declutter tasks with a single INSERT ... RETURNING."""
+        if not tasks:
+            return []
+
+        # Client-side ids act as the sentinel that keeps sort_by_parameter_order
+        # batched; a server-generated uuid would force one INSERT per row
+        result = await self.db.scalars(
+            insert(DeclutterTask).returning(
+                DeclutterTask, sort_by_parameter_order=True
+            ),
+            [{"id": uuid4(), "status": "pending", **task} for task in tasks],
+        )
+        return result.all()
+
     async def list_tasks(
         self,
         status: str | None = None,
         limit: int = 20,
-    ) -> list[DeclutterTask]:
+    ) -> Sequence[DeclutterTask]:
         """List declutter tasks with optional filtering."""
         query = select(DeclutterTask).order_by(DeclutterTask.created_at.desc())
 
@@ -51,7 +91,23 @@ class DeclutterTaskService:
         query = query.limit(limit)
 
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def stream_tasks(
+        self, limit: int = 1000, batch_size: int = 500
+    ) -> AsyncIterator[DeclutterTask]:
+        """Yield the newest tasks through a server-side cursor, batch by batch.
+
+        Cursors need a transaction, so use a ``get_db()`` session here.
+        """
+        result = await self.db.stream_scalars(
+            select(DeclutterTask)
+            .order_by(DeclutterTask.created_at.desc())
+            .limit(limit)
+            .execution_options(yield_per=batch_size)
+        )
+        async for task in result:
+            yield task
 
     async def get_task_by_id(self, task_id: UUID) -> DeclutterTask | None:
         """Get a task by its full ID."""
@@ -60,49 +116,77 @@ class DeclutterTaskService:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    def _id_prefix_filter(id_prefix: str) -> list[ColumnElement[bool]]:
+        """Build WHERE clauses matching tasks whose ID starts with the prefix."""
+        bounds = uuid_prefix_range(id_prefix)
+        if bounds is None:
+            return [false()]
+        # UUIDs sort by their bytes, so a hex prefix is a primary key range
+        return [DeclutterTask.id.between(*bounds)]
+
+    def _task_id_by_prefix(self, id_prefix: str) -> ScalarSelect[UUID]:
+        """Select the ID of the only task matching the prefix.
+
+        Selects NULL, which matches nothing, if no task or several tasks match.
+        """
+        matches = select(DeclutterTask.id).where(*self._id_prefix_filter(id_prefix))
+        # Two rows are enough to tell an ambiguous prefix apart
+        match_count = (
+            select(func.count())
+            .select_from(matches.limit(2).subquery())
+            .scalar_subquery()
+        )
+        return matches.where(match_count == 1).scalar_subquery()
+
     async def get_task_by_prefix(self, id_prefix: str) -> DeclutterTask | None:
-        """Get a task by ID prefix."""
-        result = await self.db.execute(
-            select(DeclutterTask).where(
-                func.cast(DeclutterTask.id, String).like(f"{id_prefix}%")
-            )
+        """Get a task by ID prefix.
+
+        An ambiguous prefix is treated as not found.
+        """
+        result = await self.db.scalars(
+            select(DeclutterTask).where(*self._id_prefix_filter(id_prefix)).limit(2)
         )
-        return result.scalar_one_or_none()
+        tasks = result.all()
+        return tasks[0] if len(tasks) == 1 else None
 
     async def update_task_status(
         self,
         id_prefix: str,
         status: str,
         action_taken: str | None = None,
-    ) -> DeclutterTask | None:
-        """Update a task's status."""
-        task = await self.get_task_by_prefix(id_prefix)
-        if not task:
-            return None
-
-        task.status = status
+    ) -> Row | None:
+        """Update a task's status, returning its id and item name."""
+        values = {"status": status}
         if action_taken:
-            task.action_taken = action_taken
-
-        return task
+            values["action_taken"] = action_taken
 
-    async def delete_task(self, id_prefix: str) -> bool:
-        """Delete a task by ID prefix."""
-        task = await self.get_task_by_prefix(id_prefix)
-        if not task:
-            return False
+        result = await self.db.execute(
+            update(DeclutterTask)
+            .where(DeclutterTask.id == self._task_id_by_prefix(id_prefix))
+            .values(**values)
+            .returning(DeclutterTask.id, DeclutterTask.item_name)
+        )
+        return result.one_or_none()
 
-        await self.db.delete(task)
-        return True
+    async def set_task_status(self, task_id: UUID, status: str) -> str | None:
+        """Set a task's status in one UPDATE and return its item name."""
+        result = await self.db.execute(
+            update(DeclutterTask)
+            .where(DeclutterTask.id == task_id)
+            .values(status=status)
+            .returning(DeclutterTask.item_name)
+        )
+        return result.scalar_one_or_none()
 
-    async def get_pending_count(self) -> int:
-        """Get count of pending tasks."""
+    async def delete_task(self, id_prefix: str) -> UUID | None:
+        """Delete a task by ID prefix, returning its full ID."""
         result = await self.db.execute(
-            select(func.count(DeclutterTask.id)).where(
-                DeclutterTask.status == "pending"
-            )
+            delete(DeclutterTask)
+            .where(DeclutterTask.id == self._task_id_by_prefix(id_prefix))
+            .returning(DeclutterTask.id)
         )
-        return result.scalar() or 0
+        return result.scalar_one_or_none()
 
     async def get_stats(self) -> dict[str, int]:
         """Get task statistics."""
@@ -119,32 +203,37 @@ class DeclutterTaskService:
             "total": sum(stats.values()),
         }
 
-    async def get_recent_completed(self, days: int = 7) -> int:
-        """Get count of tasks completed in recent days."""
+    async def get_dashboard(self, days: int = 7) -> dict[str, int]:
+        """Get task statistics and recent activity counts in a single query."""
         since = datetime.now(UTC) - timedelta(days=days)
         result = await self.db.execute(
-            select(func.count(DeclutterTask.id)).where(
-                and_(
-                    DeclutterTask.status == "done",
-                    DeclutterTask.updated_at >= since,
-                )
-            )
+            select(
+                func.count().filter(DeclutterTask.status == "pending"),
+                func.count().filter(DeclutterTask.status == "done"),
+                func.count().filter(DeclutterTask.status == "dismissed"),
+                func.count(),
+                func.count().filter(
+                    and_(
+                        DeclutterTask.status == "done",
+                        DeclutterTask.updated_at >= since,
+                    )
+                ),
+                func.count().filter(DeclutterTask.created_at >= since),
+            ).select_from(DeclutterTask)
         )
-        return result.scalar() or 0
-
-    async def get_recent_created(self, days: int = 7) -> int:
-        """Get count of tasks created in recent days."""
-        since = datetime.now(UTC) - timedelta(days=days)
-        result = await self.db.execute(
-            select(func.count(DeclutterTask.id)).where(
-                DeclutterTask.created_at >= since
-            )
-        )
-        return result.scalar() or 0
+        pending, done, dismissed, total, recent_done, recent_created = result.one()
+        return {
+            "pending": pending,
+            "done": done,
+            "dismissed": dismissed,
+            "total": total,
+            "recent_done": recent_done,
+            "recent_created": recent_created,
+        }
 
     async def get_completed_tasks(
         self, since: datetime | None = None, limit: int = 100
-    ) -> list[DeclutterTask]:
+    ) -> Sequence[DeclutterTask]:
         """Get completed tasks, optionally filtered by date."""
         query = (
             select(DeclutterTask)
@@ -157,7 +246,7 @@ class DeclutterTaskService:
             query = query.where(DeclutterTask.updated_at >= since)
 
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_decision_stats(self, since: datetime | None = None) -> dict[str, int]:
         """Get statistics by decision type for completed tasks."""
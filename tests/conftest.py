@@ -1,16 +1,46 @@
-import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from uuid import uuid4
+
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from src.models import Base
 
+# One shared in-memory database for the whole run; StaticPool hands every
+# checkout the same connection, so the schema is created only once
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file:test?mode=memory&cache=shared&uri=true"
+
+
+def _configure_sqlite(dbapi_connection, _connection_record) -> None:
+    # Primary keys default to PostgreSQL's gen_random_uuid(); SQLite stores
+    # UUIDs as 32-character hex strings
+    dbapi_connection.create_function("gen_random_uuid", 0, lambda: uuid4().hex)
+
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous = OFF")
+    cursor.execute("PRAGMA journal_mode = MEMORY")
+    cursor.close()
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with the driver
+    dbapi_connection.isolation_level = None
 
-@pytest.fixture
+
+def _begin(conn) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def db_engine():
-    """Create a test database engine."""
+    """Create the test database engine and schema once per session."""
     engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
+        TEST_DATABASE_URL,
         echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
+    event.listen(engine.sync_engine, "connect", _configure_sqlite)
+    event.listen(engine.sync_engine, "begin", _begin)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -20,14 +50,19 @@ async def db_engine():
     await engine.dispose()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def db_session(db_engine):
-    """Create a test database session."""
-    async_session = async_sessionmaker(
-        db_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    """Create a test database session rolled back after each test.
 
-    async with async_session() as session:
-        yield session
+    The session joins an outer transaction and turns its own commits into
+    SAVEPOINT releases, so nothing a test writes outlives it.
+    """
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await transaction.rollback()
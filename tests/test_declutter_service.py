@@ -0,0 +1,202 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from src.services.declutter import DeclutterTaskService, uuid_prefix_range
+
+FIRST_ID = UUID("1234abcd-0000-4000-8000-000000000001")
+SECOND_ID = UUID("1234abcd-0000-4000-8000-000000000002")
+
+
+def _task(item_name: str, decision: str = "discard", **fields) -> dict:
+    return {
+        "item_name": item_name,
+        "analysis": "很久沒用了",
+        "decision": decision,
+        **fields,
+    }
+
+
+def test_uuid_prefix_range_pads_prefix():
+    assert uuid_prefix_range("1234abcd") == (
+        UUID("1234abcd-0000-0000-0000-000000000000"),
+        UUID("1234abcd-ffff-ffff-ffff-ffffffffffff"),
+    )
+
+
+def test_uuid_prefix_range_odd_length():
+    assert uuid_prefix_range("ABC") == (
+        UUID("abc00000-0000-0000-0000-000000000000"),
+        UUID("abcfffff-ffff-ffff-ffff-ffffffffffff"),
+    )
+
+
+def test_uuid_prefix_range_full_id():
+    assert uuid_prefix_range(str(FIRST_ID)) == (FIRST_ID, FIRST_ID)
+    assert uuid_prefix_range(FIRST_ID.hex) == (FIRST_ID, FIRST_ID)
+
+
+def test_uuid_prefix_range_rejects_invalid_prefixes():
+    assert uuid_prefix_range("") is None
+    assert uuid_prefix_range("-") is None
+    assert uuid_prefix_range("---") is None
+    assert uuid_prefix_range("xyz") is None
+    assert uuid_prefix_range("12g4") is None
+    assert uuid_prefix_range(FIRST_ID.hex + "0") is None
+
+
+async def test_get_task_by_prefix(db_session):
+    service = DeclutterTaskService(db_session)
+    [task] = await service.create_tasks([_task("舊雨傘")])
+    # Commits release a savepoint; the fixture still rolls the test back
+    await db_session.commit()
+
+    found = await service.get_task_by_prefix(task.id.hex[:8])
+
+    assert found is not None
+    assert found.id == task.id
+
+
+async def test_get_task_by_prefix_ambiguous_or_invalid(db_session):
+    service = DeclutterTaskService(db_session)
+    await service.create_tasks(
+        [_task("舊雨傘", id=FIRST_ID), _task("舊外套", id=SECOND_ID)]
+    )
+
+    assert await service.get_task_by_prefix("1234abcd") is None
+    assert await service.get_task_by_prefix("-") is None
+    assert await service.get_task_by_prefix("") is None
+    found = await service.get_task_by_prefix(str(SECOND_ID))
+    assert found is not None
+    assert found.item_name == "舊外套"
+
+
+async def test_create_tasks_returns_rows_in_input_order(db_session):
+    service = DeclutterTaskService(db_session)
+    names = ["舊雨傘", "舊外套", "破杯子", "過期雜誌"]
+
+    tasks = await service.create_tasks([_task(name) for name in names])
+
+    assert [task.item_name for task in tasks] == names
+    assert all(task.status == "pending" for task in tasks)
+    assert len({task.id for task in tasks}) == len(names)
+    for task in tasks:
+        found = await service.get_task_by_id(task.id)
+        assert found is not None
+        assert found.item_name == task.item_name
+
+
+async def test_create_tasks_empty(db_session):
+    service = DeclutterTaskService(db_session)
+
+    assert await service.create_tasks([]) == []
+    assert (await service.get_stats())["total"] == 0
+
+
+async def test_update_task_status(db_session):
+    service = DeclutterTaskService(db_session)
+    [task] = await service.create_tasks([_task("舊雨傘")])
+
+    row = await service.update_task_status(task.id.hex[:8], "done", "捐給二手店")
+
+    assert row is not None
+    assert row.id == task.id
+    assert row.item_name == "舊雨傘"
+    await db_session.refresh(task)
+    assert task.status == "done"
+    assert task.action_taken == "捐給二手店"
+
+
+async def test_update_task_status_not_found_or_ambiguous(db_session):
+    service = DeclutterTaskService(db_session)
+    await service.create_tasks(
+        [_task("舊雨傘", id=FIRST_ID), _task("舊外套", id=SECOND_ID)]
+    )
+
+    assert await service.update_task_status("ffffffff", "done") is None
+    assert await service.update_task_status("1234abcd", "done") is None
+    assert await service.update_task_status("-", "done") is None
+    assert (await service.get_stats())["pending"] == 2
+
+
+async def test_set_task_status(db_session):
+    service = DeclutterTaskService(db_session)
+    [task] = await service.create_tasks([_task("舊雨傘")])
+
+    assert await service.set_task_status(task.id, "dismissed") == "舊雨傘"
+    await db_session.refresh(task)
+    assert task.status == "dismissed"
+
+    assert await service.set_task_status(task.id, "pending") == "舊雨傘"
+    await db_session.refresh(task)
+    assert task.status == "pending"
+
+
+async def test_set_task_status_not_found(db_session):
+    service = DeclutterTaskService(db_session)
+
+    assert await service.set_task_status(FIRST_ID, "done") is None
+
+
+async def test_delete_task(db_session):
+    service = DeclutterTaskService(db_session)
+    [task] = await service.create_tasks([_task("舊雨傘")])
+
+    assert await service.delete_task(task.id.hex[:8]) == task.id
+    assert await service.get_task_by_id(task.id) is None
+    assert await service.delete_task(task.id.hex[:8]) is None
+
+
+async def test_delete_task_ambiguous_prefix(db_session):
+    service = DeclutterTaskService(db_session)
+    await service.create_tasks(
+        [_task("舊雨傘", id=FIRST_ID), _task("舊外套", id=SECOND_ID)]
+    )
+
+    assert await service.delete_task("1234abcd") is None
+    assert (await service.get_stats())["total"] == 2
+    assert await service.delete_task(str(FIRST_ID)) == FIRST_ID
+    assert (await service.get_stats())["total"] == 1
+
+
+async def test_get_dashboard(db_session):
+    service = DeclutterTaskService(db_session)
+    now = datetime.now(UTC)
+    old = now - timedelta(days=30)
+    await service.create_tasks(
+        [
+            _task("舊雨傘", created_at=now, updated_at=now),
+            _task("舊外套", status="done", created_at=old, updated_at=now),
+            _task("破杯子", status="done", created_at=old, updated_at=old),
+            _task("過期雜誌", status="dismissed", created_at=now, updated_at=now),
+        ]
+    )
+
+    assert await service.get_dashboard(days=7) == {
+        "pending": 1,
+        "done": 2,
+        "dismissed": 1,
+        "total": 4,
+        "recent_done": 1,
+        "recent_created": 2,
+    }
+    assert await service.get_dashboard(days=60) == {
+        "pending": 1,
+        "done": 2,
+        "dismissed": 1,
+        "total": 4,
+        "recent_done": 2,
+        "recent_created": 4,
+    }
+
+
+async def test_get_dashboard_empty(db_session):
+    service = DeclutterTaskService(db_session)
+
+    assert await service.get_dashboard() == {
+        "pending": 0,
+        "done": 0,
+        "dismissed": 0,
+        "total": 0,
+        "recent_done": 0,
+        "recent_created": 0,
+    }